@@ -1,3 +1,188 @@
+import os
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, combinations
+
+# The (row, column, block) indices of each of the 81 cells of a 
+# board, in row-major order. The same for every puzzle, so it's 
+# computed once rather than per Sudoku instance.
+_CELL_COORDS: tuple[tuple[int, int, int], ...] = tuple(
+    (row, col, row // 3 * 3 + col // 3)
+    for row in range(9)
+    for col in range(9)
+    )
+
+# Maps a single-bit mask to the value it represents, e.g. 0b100 -> 3. 
+# Used wherever a lone candidate bit is turned into a value. On 
+# CPython, it measured about the same speed as bit.bit_length().
+_BIT_TO_DIGIT: tuple[int, ...] = tuple(
+    mask.bit_length() for mask in range(512)
+    )
+
+# Maps every 9-bit mask to the values it represents, in ascending 
+# order, e.g. 0b101 -> (1, 3).
+_DECODE: tuple[tuple[int, ...], ...] = tuple(
+    tuple(i + 1 for i in range(9) if mask >> i & 1)
+    for mask in range(512)
+    )
+
+# The indices of the 4 other blocks that share a row or a column with 
+# each block.
+_BLOCK_NEIGHBOURS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(
+        other for other in range(9)
+        if other != block
+        and (other // 3 == block // 3 or other % 3 == block % 3)
+        )
+    for block in range(9)
+    )
+
+
+def _build_known_masks(
+        values: list[int]
+        ) -> tuple[list[int], list[int], list[int]]:
+    """
+    Works out the known values of every row, column, and block of a 
+    board in one pass, returning them as three lists of 9-bit masks.
+
+    values holds the 81 cell values in row-major order, with 0 for a 
+    missing value. A ValueError is raised if a value isn't between 0 
+    and 9, or if a value appears more than once in a row, column, or 
+    block.
+
+    """
+
+    row_masks = [0] * 9
+    col_masks = [0] * 9
+    block_masks = [0] * 9
+
+    for value, (row, col, block) in zip(values, _CELL_COORDS):
+        if value == 0:
+            continue
+        if not 0 < value <= 9:
+            raise ValueError(
+                f"Value {value} is not a number between 0 and 9."
+                )
+        bit = 1 << (value - 1)
+        # A given value can only appear once per subsection.
+        if (row_masks[row] | col_masks[col] | block_masks[block]) & bit:
+            raise ValueError(
+                f"Value {value} appears more than once in a "
+                "row, column, or block."
+                )
+        row_masks[row] |= bit
+        col_masks[col] |= bit
+        block_masks[block] |= bit
+
+    return row_masks, col_masks, block_masks
+
+
+def _solve_recursively(
+        values: list[int]|bytearray,
+        row_masks: list[int],
+        col_masks: list[int],
+        block_masks: list[int],
+        unknown: list[int],
+        index: int
+        ) -> bool:
+    """
+    Recursively solves a Sudoku puzzle in a brute-force manner, 
+    working on flat lists of ints rather than on Cell objects.
+
+    values holds the 81 cell values in row-major order, and the three 
+    mask lists hold the known values of each row, column, and block as 
+    9-bit masks. unknown holds the indices of the empty cells. The 
+    lists are updated in place, and True is returned once every empty 
+    cell has been filled. The order of unknown may be changed.
+
+    """
+
+    if index == len(unknown):
+        return True
+
+    # Pick the remaining cell with the fewest candidates, i.e. the 
+    # most constrained one, and swap it into the current position. 
+    # Guessing there first keeps the search tree small. With exactly 
+    # 9 values, fewest candidates means most values taken, which can 
+    # be counted straight off the OR of the masks.
+    best = index
+    most_taken = -1
+    for position in range(index, len(unknown)):
+        row, col, block = _CELL_COORDS[unknown[position]]
+        taken = row_masks[row] | col_masks[col] | block_masks[block]
+        taken_count = taken.bit_count()
+        if taken_count > most_taken:
+            best = position
+            most_taken = taken_count
+            if taken_count >= 8:
+                break
+
+    unknown[index], unknown[best] = unknown[best], unknown[index]
+    cell_index = unknown[index]
+    row, col, block = _CELL_COORDS[cell_index]
+    taken = row_masks[row] | col_masks[col] | block_masks[block]
+    candidates = 0x1FF & ~taken
+
+    while candidates:
+        bit = candidates & -candidates
+        candidates ^= bit
+        values[cell_index] = _BIT_TO_DIGIT[bit]
+        row_masks[row] |= bit
+        col_masks[col] |= bit
+        block_masks[block] |= bit
+
+        if _solve_recursively(
+                values, 
+                row_masks, 
+                col_masks, 
+                block_masks, 
+                unknown, 
+                index + 1
+                ):
+            return True
+
+        # The bit is known to be set, so XOR clears it.
+        row_masks[row] ^= bit
+        col_masks[col] ^= bit
+        block_masks[block] ^= bit
+
+    values[cell_index] = 0
+    return False
+
+
+def _format_line(label: str, values: Iterable[int]) -> str:
+    """
+    Formats the 9 cell values of a row or column on one line, after 
+    its label, e.g. "h1   |_3_|_1_|_..._|". Missing values, i.e. 0s, 
+    are shown as underscores.
+
+    """
+
+    cells = "_|_".join(
+        str(value) if value != 0 else "_" for value in values
+        )
+    return f"{label}   |_{cells}_|"
+
+
+def _format_grid(values: bytes|bytearray) -> str:
+    """
+    Formats the 81 cell values of a board, in row-major order, as a 
+    9x9 grid with labelled rows and columns. Missing values, i.e. 0s, 
+    are shown as underscores.
+
+    """
+
+    representation = " " * 6
+    for column in range(9):
+        representation += f"v{column + 1}  "
+    representation += f"\n{" " * 6}{"_" * 35}\n"
+    for row in range(9):
+        line = _format_line(f"h{row + 1}", values[row * 9:row * 9 + 9])
+        representation += f"{line}\n"
+    return representation
+
+
 class Sudoku:
     """
     A class used to solve Sudoku puzzles. In these kinds of puzzles, 
@@ -10,7 +195,20 @@ class Sudoku:
     __columns: list[Sudoku.Vector]
     __cells: list[Sudoku.Cell]
     __blocks: list[Sudoku.Block]
-    __initial_state: str
+    __values: bytearray
+        The current value of each of the 81 cells in row-major order, 
+        one byte per cell. Cells read and write their values here.
+    __initial_values: bytes
+        A snapshot of __values as it was when Sudoku was initialized.
+    __unsolved_blocks: int
+        How many Blocks still have missing values.
+    __filled_cells: int
+        How many of the 81 cells have a value. Cells report each value 
+        placed into them through add_filled_cell().
+    __narrowed_blocks: list[Sudoku.Block]
+        Blocks whose Cells' possible values were narrowed while 
+        deducing another Block, waiting to be queued up again by 
+        solve().
 
     Methods
     -------
@@ -26,28 +224,52 @@ class Sudoku:
     get_cells()
         Returns __cells.
     get_initial_state()
-        Return __initial_state, a string representation of the board 
-        as it was when Sudoku was initialized.
+        Return a string representation of the board as it was when 
+        Sudoku was initialized. It's formatted straight from 
+        __initial_values, in the same layout as __repr__().
+    add_filled_cell()
+        Adds 1 to __filled_cells. Called by a Cell when a value is 
+        placed into it while it's empty.
     is_completed()
         Returns a boolean to indicate whether the puzzle is finished 
-        or not.
+        or not, i.e. whether __filled_cells has reached 81.
     assert_validity()
         Raises an InvalidGameSolution exception if each subsection of 
         a Sudoku puzzle doesn't contain exactly the values 1-9.
     __deduce_block_values(block: Sudoku.Block)
         Attemps to find missing Cell values of a Block, given what 
-        known values of said Cell's row and columns are. It cannot 
-        always solve puzzles single-handedly.
-    __value_is_safe(cell: Sudoku.Cell, value: int)
-        Returns True if a Cell's value doesn't exist in its given row, 
-        column, or Block. Otherwise returns False.
-    __solve_recursively(cells: list[Sudoku.Cell], index: int)
-        Recursively solves Sudoku puzzles in a brute-force manner. 
-        It's less efficient than using deduction.
-    solve()
+        known values of said Cell's row and columns are, and returns 
+        how many it found. It cannot always solve puzzles 
+        single-handedly.
+    __place_naked_subset_values(
+            cells: list[Sudoku.Cell], masks: list[int])
+        Given a Block's empty Cells and their possible values as 
+        masks, removes the values claimed by naked pairs and triples 
+        from the other Cells, as well as from the rest of a row or 
+        column the pair or triple lies in, noting any other Block 
+        narrowed this way in __narrowed_blocks. Places any value that 
+        is left as a Cell's only possibility, stores the narrowed 
+        possible values of the rest, and returns how many it placed.
+    __solve_by_brute_force()
+        Copies the subsections' masks into flat lists of ints and 
+        fills in the missing values with _solve_recursively(), which 
+        works directly on __values, so the Cells hold the solution 
+        once it returns. The values are then placed again to update 
+        the masks. It's less efficient than using deduction.
+    solve(verbose: bool)
         Solves a Sudoku puzzle. Initially, __deduce_block_values() is 
-        called, but if this proves insufficient, __solve_recursively() 
-        is called as well.
+        called, but if this proves insufficient, 
+        __solve_by_brute_force() is called as well. The initial and 
+        solved states are printed unless verbose is False.
+    solve_board(board: list[list[int]])
+        A static method that solves a board given in the same format 
+        as the constructor's, without building a Sudoku object, and 
+        returns the solved board.
+    solve_boards(boards: list[list[list[int]]], processes: int|None)
+        A static method that solves many boards in parallel with 
+        solve_board(), spread over a pool of worker processes. Must 
+        be called from under an `if __name__ == "__main__":` guard 
+        where worker processes are spawned, e.g. on Windows or macOS.
 
     Inner classes
     -------------
@@ -88,12 +310,18 @@ class Sudoku:
         for row in board:
             assert len(row) == 9
 
+        self.__values = bytearray(81)
         rows, columns, blocks, cells = Sudoku.__unpack_vectors(self, board)
         self.__rows: list[Sudoku.Vector] = rows
         self.__columns: list[Sudoku.Vector] = columns
         self.__blocks: list[Sudoku.Block] = blocks
         self.__cells: list[Sudoku.Cell] = cells
-        self.__initial_state: str = repr(self)
+        self.__initial_values = bytes(self.__values)
+        self.__unsolved_blocks = sum(
+            1 for block in blocks if block.get_unknown_mask() != 0
+            )
+        self.__filled_cells = 81 - self.__values.count(0)
+        self.__narrowed_blocks: list[Sudoku.Block] = []
 
     def __unpack_vectors(self, board: list[list[int]]) -> tuple[
         list[Sudoku.Vector], 
@@ -101,76 +329,48 @@ class Sudoku:
         list[Sudoku.Block],
         list[Sudoku.Cell]
         ]:
-        rows: list[Sudoku.Vector] = []
-        columns: list[Sudoku.Vector] = []
-        blocks: list[Sudoku.Block] = []
-        cells: list[Sudoku.Cell] = []
-        row_counter = 1
-        column_counter = 1
+        flat_board = list(chain.from_iterable(board))
 
-        # Populate the lists of columns and blocks.
-        for num in range(9):
-            col_vector = Sudoku.Vector(orientation="column", id=(num + 1))
-            columns.append(col_vector)
-            new_block = Sudoku.Block(id=(num + 1))
-            blocks.append(new_block)
+        # Work out the known values of every row, column, and block in 
+        # one pass over the clues, before any objects are built.
+        row_masks, col_masks, block_masks = _build_known_masks(flat_board)
 
-        # Populate the lists of rows and cells.
-        for row in board:
-            row_vector = Sudoku.Vector(orientation="row", id=(row_counter))
-
-            for num in row:
-                row_id = row_vector.get_id()
-                col_id = columns[column_counter-1].get_id()
-
-                if row_id in (1,2,3) and col_id in (1,2,3):
-                    cell_block_id = 1
-                elif row_id in (1,2,3) and col_id in (4,5,6):
-                    cell_block_id = 2
-                elif row_id in (1,2,3) and col_id in (7,8,9):
-                    cell_block_id = 3
-                elif row_id in (4,5,6) and col_id in (1,2,3):
-                    cell_block_id = 4
-                elif row_id in (4,5,6) and col_id in (4,5,6):
-                    cell_block_id = 5
-                elif row_id in (4,5,6) and col_id in (7,8,9):
-                    cell_block_id = 6
-                elif row_id in (7,8,9) and col_id in (1,2,3):
-                    cell_block_id = 7
-                elif row_id in (7,8,9) and col_id in (4,5,6):
-                    cell_block_id = 8
-                elif row_id in (7,8,9) and col_id in (7,8,9):
-                    cell_block_id = 9
-                
-                for block in blocks:
-                    if block.get_id() == cell_block_id:
-                        cell_block = block
-
-                cell = self.Cell(
-                    row=row_vector,
-                    col=columns[column_counter-1],
-                    block=cell_block,
-                    value=num
-                    )
-                cells.append(cell)
-                column_counter += 1
+        values = self.__values
+        values[:] = bytes(flat_board)
+
+        rows = [
+            Sudoku.Vector(id=(num + 1), is_row=True, known_mask=mask)
+            for num, mask in enumerate(row_masks)
+            ]
+        columns = [
+            Sudoku.Vector(id=(num + 1), is_row=False, known_mask=mask)
+            for num, mask in enumerate(col_masks)
+            ]
+        blocks = [
+            Sudoku.Block(id=(num + 1), known_mask=mask)
+            for num, mask in enumerate(block_masks)
+            ]
+        cells: list[Sudoku.Cell] = []
+
+        # Create the cells in row-major order, looking up the indices 
+        # of each one's row, column, and block in _CELL_COORDS.
+        for index, (row, col, block) in enumerate(_CELL_COORDS):
+            cell = self.Cell(
+                row=rows[row],
+                col=columns[col],
+                block=blocks[block],
+                values=values,
+                index=index,
+                game=self
+                )
+            cells.append(cell)
 
-            rows.append(row_vector)
-            row_counter += 1
-            column_counter = 1
-        
         return rows, columns, blocks, cells
 
     def __repr__(self) -> str:
         """Represent a Sudoku object as a 9x9 grid with cell values."""
 
-        representation = " " * 6
-        for column in range(9):
-            representation += f"v{column + 1}  "
-        representation += f"\n{" " * 6}{"_" * 35}\n"
-        for row in self.__rows:
-            representation += f"{str(row)}\n"
-        return representation     
+        return _format_grid(self.__values)
 
     def get_rows(self) -> list[Sudoku.Vector]:
         return self.__rows
@@ -182,14 +382,13 @@ class Sudoku:
         return self.__cells
 
     def get_initial_state(self) -> str:
-        return self.__initial_state
+        return _format_grid(self.__initial_values)
+
+    def add_filled_cell(self) -> None:
+        self.__filled_cells += 1
 
     def is_completed(self) -> bool:
-        for vectors in [self.__rows, self.__columns]:
-            for vector in vectors:
-                if len(vector.get_known_values()) != 9:
-                    return False
-        return True
+        return self.__filled_cells == 81
 
     def assert_validity(self) -> None:
         subsections: list[list[Sudoku.Vector] | list[Sudoku.Block]] = [
@@ -200,146 +399,288 @@ class Sudoku:
         
         for areas in subsections:
             for area in areas:
-                values = area.get_known_values()
-                values.sort()
-
-                if values != [1, 2, 3, 4, 5, 6, 7, 8, 9]:
+                # All of the values 1-9 must be present.
+                if area.get_known_mask() != 0x1FF:
                     raise Sudoku.InvalidGameSolution(
                         "Error! This game was solved incorrectly."
                         )
             
-    def __deduce_block_values(self, block: Sudoku.Block) -> None:
-        unknown_values = block.get_unknown_values()
-        # If the block has unknown/missing values, attempt to deduce 
-        # the value of each empty cell.
-        if len(unknown_values) != 0:
-            for cell in block.get_cells():
+    def __deduce_block_values(self, block: Sudoku.Block) -> int:
+        solved_count = 0
+        progress = True
+        # Read this once rather than per cell. It's kept in step with 
+        # the block as values are placed below.
+        unknown_mask = block.get_unknown_mask()
+        # A filled cell never becomes empty again, so each sweep only 
+        # visits the cells the previous one left empty.
+        empty_cells = [
+            cell for cell in block.get_cells() if cell.get_value() == 0
+            ]
+
+        # Sweep the block's cells until a whole sweep fills none. A 
+        # newly filled cell can narrow down its neighbours, so the 
+        # block is swept again rather than recursed into.
+        while progress:
+            progress = False
+            cells = empty_cells
+            empty_cells = []
+            empty_masks: list[int] = []
+
+            for cell in cells:
                 # If a cell's value is missing, remove overlaps 
                 # between the block's missing numbers and the numbers 
                 # already present in the cell's row and column. Then 
                 # update the cell's possible values to reflect 
-                # remaining possibilities.
+                # remaining possibilities. The check is still needed, 
+                # as naked subsets may have filled the cell since the 
+                # last sweep.
                 if cell.get_value() == 0:
-                    possible_values = unknown_values.copy()
-                    vectors = [cell.get_row(), cell.get_col()]
-
-                    for vector in vectors:
-                        for existing_value in vector.get_known_values():
-                            if existing_value in possible_values:
-                                possible_values.remove(existing_value)
-
-                        # If there's only one possible value for this 
-                        # cell, set its value to that, add it to its 
-                        # block's known values, and run solve_block() 
-                        # again. Otherwise, simply note its new 
-                        # possible values.
-                        if len(possible_values) == 1:
-                            value = possible_values[0]
-                            cell.set_value(value)
-                            block.add_known_value(value)
-
-                            for vector in vectors:
-                                vector.add_known_value(value)
-
-                            self.__deduce_block_values(block)
-                        else:
-                            cell.set_possible_values(possible_values)
-
-    def __value_is_safe(self, cell: Sudoku.Cell, value: int) -> bool:
-        subsections: list[Sudoku.Subsection] = [
-            cell.get_row(), 
-            cell.get_col(), 
-            cell.get_block()
-            ]
+                    row = cell.get_row()
+                    col = cell.get_col()
+                    possible = unknown_mask & ~(
+                        row.get_known_mask() | col.get_known_mask()
+                        )
+                    # Values that naked subsets have already ruled out 
+                    # for this cell stay ruled out.
+                    known_possible = cell.get_possible_mask()
+                    if known_possible is not None:
+                        possible &= known_possible
+
+                    # If there's only one possible value for this 
+                    # cell, place it, which also adds it to the known 
+                    # values of the cell's row, column, and block. 
+                    # Otherwise, simply note its new possible values.
+                    if possible.bit_count() == 1:
+                        value = _BIT_TO_DIGIT[possible]
+                        cell.place_value(value)
+                        unknown_mask ^= possible
+                        solved_count += 1
+                        progress = True
+                    else:
+                        cell.set_possible_mask(possible)
+                        empty_cells.append(cell)
+                        empty_masks.append(possible)
+
+            # Only look for naked pairs and triples once single values 
+            # run dry, when every mask collected above is up to date.
+            if not progress and len(empty_cells) > 2:
+                placed = self.__place_naked_subset_values(
+                    empty_cells, 
+                    empty_masks
+                    )
+                if placed != 0:
+                    unknown_mask = block.get_unknown_mask()
+                    solved_count += placed
+                    progress = True
+
+        return solved_count
+
+    def __place_naked_subset_values(
+            self, 
+            cells: list[Sudoku.Cell], 
+            masks: list[int]
+            ) -> int:
+        # If 2 (or 3) empty cells of a block can only hold the same 2 
+        # (or 3) values between them, those values can't go in any of 
+        # the block's other cells. Remove them there, then place any 
+        # value that has become the only possibility for its cell.
+        block = cells[0].get_block()
+        for size in (2, 3):
+            for group in combinations(range(len(cells)), size):
+                union = 0
+                for index in group:
+                    union |= masks[index]
+
+                if union.bit_count() != size:
+                    continue
+
+                for index in range(len(masks)):
+                    if index not in group:
+                        masks[index] &= ~union
+
+                # If the group's cells also share a row or column, the 
+                # values can't go anywhere else in it either. Those 
+                # cells are in other blocks, so the narrowed masks are 
+                # stored, and their blocks noted in __narrowed_blocks 
+                # for solve() to queue up again.
+                rows = {cells[index].get_row() for index in group}
+                cols = {cells[index].get_col() for index in group}
+                for lines in (rows, cols):
+                    if len(lines) != 1:
+                        continue
+                    for cell in lines.pop().get_cells():
+                        if (cell.get_block() is block 
+                                or cell.get_value() != 0):
+                            continue
+                        mask = cell.get_possible_mask()
+                        if mask is None:
+                            mask = 0x1FF & ~(
+                                cell.get_row().get_known_mask() 
+                                | cell.get_col().get_known_mask() 
+                                | cell.get_block().get_known_mask()
+                                )
+                        if mask & union:
+                            cell.set_possible_mask(mask & ~union)
+                            self.__narrowed_blocks.append(
+                                cell.get_block()
+                                )
+
+        placed_count = 0
+        for cell, mask in zip(cells, masks):
+            if mask.bit_count() == 1:
+                cell.place_value(_BIT_TO_DIGIT[mask])
+                placed_count += 1
+            else:
+                cell.set_possible_mask(mask)
+
+        return placed_count
+
+    def __solve_by_brute_force(self) -> None:
+        # The search fills in the shared bytearray directly, so the 
+        # Cells already hold the solution once it returns. Placing 
+        # the values again below updates their subsections' masks.
+        values = self.__values
+        row_masks = [row.get_known_mask() for row in self.__rows]
+        col_masks = [col.get_known_mask() for col in self.__columns]
+        block_masks = [block.get_known_mask() for block in self.__blocks]
+        unknown = [index for index, value in enumerate(values) if value == 0]
+
+        if not _solve_recursively(
+                values, 
+                row_masks, 
+                col_masks, 
+                block_masks, 
+                unknown, 
+                0
+                ):
+            raise Sudoku.InvalidGameSolution(
+                "Error! This game has no solution."
+                )
+
+        for index in unknown:
+            cell = self.__cells[index]
+            value = values[index]
+            cell.place_value(value)
+
+        # The search filled the cells before place_value() saw them, 
+        # so they weren't counted as they were placed.
+        self.__filled_cells += len(unknown)
+        self.__unsolved_blocks = 0
+
+    def solve(self, verbose: bool = True) -> None:
+        """Solves the Sudoku puzzle.
+
+        Call the __deduce_block_values() function on each of its 9 
+        blocks, queueing a block up again whenever a block sharing 
+        its rows or columns gains values. Once no block makes any 
+        more progress, call __solve_by_brute_force() if the puzzle 
+        still isn't complete. Once it is solved, assert that the 
+        puzzle solution is valid, and print the solution if verbose 
+        is True.
         
-        for section in subsections: 
-            if value in section.get_known_values():
-                return False
+        """
 
-        return True
+        # Deduce values block by block. When a block gains values, 
+        # the blocks sharing its rows or columns may now be deducible 
+        # too, so they are queued up again.
+        pending = deque(self.__blocks)
 
-    def __solve_recursively(self, cells: list[Sudoku.Cell], index: int):
-        try:
-            cell = cells[index]
-        except IndexError:
-            return True
+        while pending and self.__unsolved_blocks != 0:
+            block = pending.popleft()
 
-        # Base case: The final Cell of the puzzle has been reached.
-        if len(cells) == index:
-            possible_values = cell.get_possible_values()
-            if possible_values != None:
-                for value in possible_values:
-                    if self.__value_is_safe(cell, value):
-                        cell.set_value(value)
-                        cell.get_block().add_known_value(value)
-                        cell.get_row().add_known_value(value)
-                        cell.get_col().add_known_value(value)
-                        return True
-            else:
-                return True
+            if block.get_unknown_mask() == 0:
+                continue
 
-        value = cell.get_value()
+            if self.__deduce_block_values(block) != 0:
+                if block.get_unknown_mask() == 0:
+                    self.__unsolved_blocks -= 1
 
-        # If cell is already occupied then move forward
-        if value != 0 and self.__value_is_safe(cell, value):
-            return self.__solve_recursively(cells, index + 1)
+                for index in _BLOCK_NEIGHBOURS[block.get_id() - 1]:
+                    neighbour = self.__blocks[index]
+                    if neighbour not in pending:
+                        pending.append(neighbour)
 
-        for num in range(1, 10):
-            
-            # If it is safe to place num at current position
-            if self.__value_is_safe(cell, num):
-                cell.set_value(num)
-                cell.get_block().add_known_value(num)
-                cell.get_row().add_known_value(num)
-                cell.get_col().add_known_value(num)
-                
-                if self.__solve_recursively(cells, index + 1):
-                    return True
-                
-                cell.set_value(0)
-                cell.get_block().remove_known_value(num)
-                cell.get_row().remove_known_value(num)
-                cell.get_col().remove_known_value(num)
-
-        return False
-
-    def solve(self) -> None:
-        """Solves the Sudoku puzzle.
+            # Blocks whose cells were narrowed by a naked pair or 
+            # triple in this block may now be deducible, even if 
+            # nothing was placed here.
+            for narrowed in self.__narrowed_blocks:
+                if narrowed not in pending:
+                    pending.append(narrowed)
+            self.__narrowed_blocks.clear()
 
-        While the Sudoku puzzle hasn't been completed yet, iterate 
-        through each of its 9 blocks. If a block hasn't been solved,
-        call the __deduce_block_values() function on it. If the 
-        Sudoku puzzle's state remains unchanged after any of the 
-        iterations, call __solve_recursively() to solve it. Once it is 
-        solved, assert that the puzzle solution is valid, and print the
-        solution.
-        
-        """
+        if self.__unsolved_blocks != 0:
+            self.__solve_by_brute_force()
 
-        while not self.is_completed():
-            initial_state = repr(self)
+        self.assert_validity()
 
-            for block in self.__blocks:
-                unknown_values = block.get_unknown_values()
+        if verbose:
+            print(
+                f"Initial puzzle state:\n\n {self.get_initial_state()}\n"
+                )
+            print(f"Solved puzzle state:\n\n {repr(self)}")
 
-                if len(unknown_values) != 0:
-                    self.__deduce_block_values(block)
+    @staticmethod
+    def solve_board(board: list[list[int]]) -> list[list[int]]:
+        """
+        Solves a board and returns the solution as a new list of 9 
+        rows, leaving the input untouched. Unlike solve(), no Cell, 
+        Vector, or Block objects are built and nothing is printed, 
+        which makes this the faster way to solve many puzzles in a 
+        batch.
 
-            current_state = repr(self)
+        """
 
-            if initial_state == current_state:
-                unknown_cells: list[Sudoku.Cell] = []
+        assert len(board) == 9
+        for row in board:
+            assert len(row) == 9
 
-                for cell in self.get_cells():
-                    if cell.get_value() == 0:
-                        unknown_cells.append(cell)
+        values = [value for row in board for value in row]
+        row_masks, col_masks, block_masks = _build_known_masks(values)
+
+        unknown = [index for index, value in enumerate(values) if value == 0]
+
+        if not _solve_recursively(
+                values, 
+                row_masks, 
+                col_masks, 
+                block_masks, 
+                unknown, 
+                0
+                ):
+            raise Sudoku.InvalidGameSolution(
+                "Error! This game has no solution."
+                )
+
+        return [values[row * 9:row * 9 + 9] for row in range(9)]
+
+    @staticmethod
+    def solve_boards(
+            boards: list[list[list[int]]], 
+            processes: int|None = None
+            ) -> list[list[list[int]]]:
+        """
+        Solves many boards with solve_board() and returns their 
+        solutions in the same order. Each board is independent of the 
+        others, so they're split between a pool of worker processes, 
+        one per CPU core unless processes says otherwise.
 
-                self.__solve_recursively(unknown_cells, 0)
+        On platforms that start worker processes by spawning a fresh 
+        interpreter (Windows, and macOS by default), each worker 
+        re-imports the calling script. Call solve_boards() from under 
+        an `if __name__ == "__main__":` guard there, or the workers 
+        will fail.
 
-        self.assert_validity()
+        """
+
+        workers = processes or os.cpu_count() or 1
+        # Hand boards out in chunks, as a single puzzle is usually too 
+        # quick to be worth a round trip to a worker.
+        chunksize = max(1, len(boards) // (workers * 4))
 
-        print(f"Initial puzzle state:\n\n {self.get_initial_state()}\n")
-        print(f"Solved puzzle state:\n\n {repr(self)}")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(Sudoku.solve_board, boards, chunksize=chunksize)
+                )
 
     class Subsection:
         """
@@ -350,15 +691,18 @@ class Sudoku:
         ----------
         __id: int
         __cells: list[Sudoku.Cell]
-        __unknown_values: list[int]
-        __known_values: list[int]
+        __known_mask: int
+            A 9-bit mask where bit k is set if the value k+1 has 
+            already been assigned to one of the subsection's cells.
 
         Methods
         -------
         get_id()
             Returns the subsection's id, which is between 1 and 9.
         add_cell(cell: Sudoku.Cell)
-            Adds a Cell object to __cells. There ought to be 9 cells.
+            Adds a Cell object to __cells. There ought to be 9 cells. 
+            The Cell's value should already be part of the known_mask 
+            the subsection was created with.
         get_unknown_values()
             Returns a list of ints, representing each value between 
             1-9 that has yet to be assigned to one of the subsection's 
@@ -367,45 +711,55 @@ class Sudoku:
             Returns a list of ints, representing each value between 
             1-9 that has already been assigned to one of the 
             subsection's cells.
+        get_known_mask()
+            Returns __known_mask.
+        get_unknown_mask()
+            Returns the complement of __known_mask within the 9 bits.
+        has_known(value: int)
+            Returns True if the value has already been assigned to one 
+            of the subsection's cells.
         add_known_value(value: int)
-            Adds an int value to __known_values and removes it from
-            __unknown_values.
+            Sets the value's bit in __known_mask.
+        remove_known_value(value: int)
+            Clears the value's bit in __known_mask.
         get_cells()
             Returns __cells.
 
         """
 
-        def __init__(self, id: int) -> None:
+        __slots__ = ("__id", "__cells", "__known_mask")
+
+        def __init__(self, id: int, known_mask: int = 0) -> None:
             self.__id = id
             self.__cells: list[Sudoku.Cell] = []
-            self.__known_values: list[int] = []
-            self.__unknown_values = [1, 2, 3, 4, 5, 6, 7, 8, 9]
+            self.__known_mask = known_mask
 
         def get_id(self) -> int:
             return self.__id
 
         def add_cell(self, cell: Sudoku.Cell) -> None:
             self.__cells.append(cell)
-            value = cell.get_value()
-            if value != 0:
-                self.__known_values.append(value)
-                self.__unknown_values.remove(value)
 
         def get_unknown_values(self) -> list[int]:
-            return self.__unknown_values
+            return list(_DECODE[0x1FF ^ self.__known_mask])
         
         def get_known_values(self) -> list[int]:
-            return self.__known_values
+            return list(_DECODE[self.__known_mask])
+
+        def get_known_mask(self) -> int:
+            return self.__known_mask
+
+        def get_unknown_mask(self) -> int:
+            return 0x1FF ^ self.__known_mask
+
+        def has_known(self, value: int) -> bool:
+            return bool(self.__known_mask & (1 << (value - 1)))
         
         def remove_known_value(self, value: int) -> None:
-            self.__unknown_values.append(value)
-            if value in self.__known_values:
-                self.__known_values.remove(value)
+            self.__known_mask &= ~(1 << (value - 1))
         
         def add_known_value(self, value: int) -> None:
-            self.__known_values.append(value)
-            if value in self.__unknown_values:
-                self.__unknown_values.remove(value)
+            self.__known_mask |= 1 << (value - 1)
 
         def get_cells(self) -> list[Sudoku.Cell]:
             return self.__cells
@@ -413,8 +767,10 @@ class Sudoku:
     class Block(Subsection):
         """A child class extending Subsection. Each has 9 cells."""
 
-        def __init__(self, id: int) -> None:
-            super().__init__(id)
+        __slots__ = ()
+
+        def __init__(self, id: int, known_mask: int = 0) -> None:
+            super().__init__(id, known_mask)
 
     class Vector(Subsection):
         """
@@ -423,31 +779,31 @@ class Sudoku:
 
         Attributes
         ----------
-        __orientation: str
-            Must only be "row" or "column".
+        __is_row: bool
+            True if the vector is a row, False if it's a column.
 
         """
 
-        def __init__(self, id: int, orientation: str) -> None:
-            super().__init__(id)
-            assert orientation == "row" or "column"
-            self.__orientation = orientation
+        __slots__ = ("__is_row",)
+
+        def __init__(
+                self, 
+                id: int, 
+                is_row: bool, 
+                known_mask: int = 0
+                ) -> None:
+            super().__init__(id, known_mask)
+            self.__is_row = is_row
 
         def __repr__(self) -> str:
-            if self.__orientation == "row":
-                name = "h"
-            else:
-                name = "v"
+            name = "h" if self.__is_row else "v"
             return f"{name}{self.get_id()}"
 
         def __str__(self) -> str:
-            representation = f"{repr(self)}   |_"
-            for cell in self.get_cells():
-                value = cell.get_value()
-                if value == 0:
-                    value = "_"
-                representation += str(value) + "_|_"
-            return representation[0:-1]
+            return _format_line(
+                repr(self), 
+                (cell.get_value() for cell in self.get_cells())
+                )
 
     class Cell:
         """
@@ -457,17 +813,27 @@ class Sudoku:
         ----------
         __row: Sudoku.Vector
         __column: Sudoku.Vector
-        __value: int
-        __possible_values: list[int]|None
+        __values: bytearray
+            The board's shared bytearray of cell values.
+        __index: int
+            The position of the Cell's value within __values.
+        __possible_mask: int|None
+            A 9-bit mask of the values the Cell could still hold, or 
+            None if it hasn't been worked out.
         __block: Sudoku.Block
+        __game: Sudoku
+            The Sudoku the Cell belongs to, which counts its filled 
+            cells.
 
         Methods
         -------
         get_possible_values()
             Returns a list of ints of which one will be set to the 
-            Cell's value later. 
-        set_possible_values(values: list[int])
-            Populates __possible_values.
+            Cell's value later, decoded from __possible_mask. 
+        get_possible_mask()
+            Returns __possible_mask.
+        set_possible_mask(mask: int)
+            Populates __possible_mask.
         get_row()
             Returns the row Vector that contains the Cell.
         get_col()
@@ -476,32 +842,56 @@ class Sudoku:
             Returns the current value of the cell. A missing value is 
             represented by a 0.
         set_value(value: int)
-            Sets __value to the believed final value and sets 
-            __possible_values to None.
+            Sets the Cell's value in __values to the believed final 
+            value and sets __possible_mask to None.
+        place_value(value: int)
+            Calls set_value() and adds the value to the known values 
+            of the Cell's row, column, and Block in one step. If the 
+            Cell was empty, __game is told another cell was filled.
 
         """
 
+        __slots__ = (
+            "__row", 
+            "__column", 
+            "__values", 
+            "__index", 
+            "__possible_mask", 
+            "__block",
+            "__game"
+            )
+
         def __init__(
                 self, 
                 row: Sudoku.Vector, 
                 col: Sudoku.Vector, 
                 block: Sudoku.Block, 
-                value: int = 0
+                values: bytearray, 
+                index: int,
+                game: Sudoku
                 ) -> None:
             self.__row = row
             self.__column = col
-            self.__value = value
-            self.__possible_values = None
+            self.__values = values
+            self.__index = index
+            self.__possible_mask = None
             self.__block = block
+            self.__game = game
             block.add_cell(self)
             row.add_cell(self)
             col.add_cell(self)
 
         def get_possible_values(self) -> list[int]|None:
-            return self.__possible_values
+            mask = self.__possible_mask
+            if mask is None:
+                return None
+            return list(_DECODE[mask])
+
+        def get_possible_mask(self) -> int|None:
+            return self.__possible_mask
 
-        def set_possible_values(self, values: list[int]) -> None:
-            self.possible_values = values
+        def set_possible_mask(self, mask: int) -> None:
+            self.__possible_mask = mask
 
         def get_row(self) -> Sudoku.Vector:
             return self.__row
@@ -513,11 +903,19 @@ class Sudoku:
             return self.__block
 
         def get_value(self) -> int:
-            return self.__value
+            return self.__values[self.__index]
 
         def set_value(self, value: int) -> None:
-            self.__value = value
-            self.__possible_values = None
+            self.__values[self.__index] = value
+            self.__possible_mask = None
+
+        def place_value(self, value: int) -> None:
+            if self.__values[self.__index] == 0:
+                self.__game.add_filled_cell()
+            self.set_value(value)
+            self.__row.add_known_value(value)
+            self.__column.add_known_value(value)
+            self.__block.add_known_value(value)
 
     class InvalidGameSolution(Exception):
         """A simple custom Exception class."""
@@ -0,0 +1,201 @@
+import unittest
+
+from Sudoku import Sudoku
+
+# The easy board from main.py.
+EASY_BOARD = [
+    [3, 1, 0, 6, 0, 5, 4, 0, 0],
+    [6, 0, 4, 2, 1, 0, 0, 8, 3],
+    [9, 0, 0, 0, 3, 0, 0, 2, 0],
+    [2, 4, 7, 5, 6, 0, 0, 3, 0],
+    [8, 6, 0, 1, 0, 0, 0, 0, 0],
+    [0, 0, 5, 3, 0, 2, 6, 7, 0],
+    [0, 8, 0, 0, 0, 0, 0, 0, 4],
+    [0, 3, 0, 0, 0, 0, 7, 6, 2],
+    [5, 0, 0, 0, 7, 0, 8, 0, 9]
+    ]
+
+# The expert board from main.py.
+EXPERT_BOARD = [
+    [0, 0, 0, 0, 0, 0, 0, 6, 0],
+    [0, 2, 0, 3, 0, 0, 1, 0, 0],
+    [5, 0, 0, 8, 0, 9, 0, 0, 0],
+    [8, 0, 0, 0, 5, 0, 0, 9, 6],
+    [0, 4, 0, 6, 0, 0, 0, 0, 0],
+    [0, 0, 0, 4, 0, 0, 0, 0, 3],
+    [9, 0, 0, 0, 7, 0, 5, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 4, 0],
+    [0, 1, 0, 9, 0, 0, 8, 0, 0]
+    ]
+
+
+class NakedSubsetTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # The top-left block is missing 1, 2, and 3. The 3s in columns
+        # 1 and 2 leave (1, 1) and (1, 2) with only 1 and 2 between
+        # them, a naked pair in row 1, while (3, 3) could still be 1,
+        # 2, or 3. Only the pair rules out 1 and 2 there.
+        self.board = [
+            [0, 0, 4, 0, 0, 0, 0, 0, 0],
+            [5, 6, 7, 0, 0, 0, 0, 0, 0],
+            [8, 9, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [3, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 3, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0]
+            ]
+        self.game = Sudoku(self.board)
+        self.cells = self.game.get_cells()
+        top_left = self.cells[0].get_block()
+        self.placed = self.game._Sudoku__deduce_block_values(top_left)
+
+    def test_value_left_by_naked_pair_is_placed(self) -> None:
+        self.assertEqual(self.placed, 1)
+        self.assertEqual(self.cells[20].get_value(), 3)
+
+    def test_naked_pair_keeps_its_values(self) -> None:
+        for index in (0, 1):
+            self.assertEqual(self.cells[index].get_value(), 0)
+            self.assertEqual(self.cells[index].get_possible_values(), [1, 2])
+
+    def test_naked_pair_prunes_the_rest_of_its_row(self) -> None:
+        for index in range(3, 9):
+            possible = self.cells[index].get_possible_values()
+            self.assertNotIn(1, possible)
+            self.assertNotIn(2, possible)
+        self.assertEqual(
+            self.cells[3].get_possible_values(),
+            [3, 5, 6, 7, 8, 9]
+            )
+
+    def test_blocks_narrowed_along_the_row_are_noted(self) -> None:
+        # solve() queues these blocks up again, even though nothing
+        # was placed in them.
+        narrowed = self.game._Sudoku__narrowed_blocks
+        self.assertEqual({block.get_id() for block in narrowed}, {2, 3})
+
+    def test_narrowed_values_are_stored_for_cells_left_empty(self) -> None:
+        # As above, but with 4 missing too and kept out of (1, 1) and
+        # (1, 2), so the naked pair only narrows (1, 3) and (3, 3) down
+        # to 3 and 4 without filling them.
+        board = [row.copy() for row in self.board]
+        board[0][2] = 0
+        board[7][0] = 4
+        board[4][1] = 4
+        game = Sudoku(board)
+        cells = game.get_cells()
+
+        placed = game._Sudoku__deduce_block_values(cells[0].get_block())
+
+        self.assertEqual(placed, 0)
+        for index in (2, 20):
+            self.assertEqual(cells[index].get_possible_values(), [3, 4])
+
+
+class CompletionTests(unittest.TestCase):
+
+    def test_values_placed_through_cells_complete_the_game(self) -> None:
+        solution = Sudoku.solve_board(EASY_BOARD)
+        board = [row.copy() for row in solution]
+        board[8][7] = 0
+        board[8][8] = 0
+        game = Sudoku(board)
+        cells = game.get_cells()
+
+        self.assertFalse(game.is_completed())
+        cells[79].place_value(solution[8][7])
+        self.assertFalse(game.is_completed())
+        cells[80].place_value(solution[8][8])
+        self.assertTrue(game.is_completed())
+        game.assert_validity()
+
+    def test_solve_completes_the_game(self) -> None:
+        game = Sudoku(EASY_BOARD)
+        self.assertFalse(game.is_completed())
+        game.solve(verbose=False)
+        self.assertTrue(game.is_completed())
+
+
+class BoardValidationTests(unittest.TestCase):
+
+    def test_clue_above_9_is_rejected(self) -> None:
+        board = [row.copy() for row in EASY_BOARD]
+        board[0][2] = 10
+        with self.assertRaises(ValueError):
+            Sudoku(board)
+
+    def test_negative_clue_is_rejected(self) -> None:
+        board = [row.copy() for row in EASY_BOARD]
+        board[0][2] = -1
+        with self.assertRaises(ValueError):
+            Sudoku(board)
+
+
+class SolveBoardTests(unittest.TestCase):
+
+    def test_solution_matches_solve_and_input_is_untouched(self) -> None:
+        board = [row.copy() for row in EASY_BOARD]
+        solution = Sudoku.solve_board(board)
+
+        game = Sudoku(EASY_BOARD)
+        game.solve(verbose=False)
+        values = [cell.get_value() for cell in game.get_cells()]
+
+        self.assertEqual(
+            solution,
+            [values[row * 9:row * 9 + 9] for row in range(9)]
+            )
+        self.assertEqual(board, EASY_BOARD)
+
+    def test_duplicate_clue_is_rejected(self) -> None:
+        board = [row.copy() for row in EASY_BOARD]
+        board[0][2] = 3
+        with self.assertRaises(ValueError):
+            Sudoku.solve_board(board)
+
+    def test_out_of_range_clue_is_rejected(self) -> None:
+        for value in (10, -1):
+            board = [row.copy() for row in EASY_BOARD]
+            board[0][2] = value
+            with self.assertRaises(ValueError):
+                Sudoku.solve_board(board)
+
+    def test_unsolvable_board_raises(self) -> None:
+        # No value is left for the last cell of the first row.
+        board = [[0] * 9 for _ in range(9)]
+        board[0] = [1, 2, 3, 4, 5, 6, 7, 8, 0]
+        board[1][8] = 9
+        with self.assertRaises(Sudoku.InvalidGameSolution):
+            Sudoku.solve_board(board)
+
+
+class SolveBoardsTests(unittest.TestCase):
+
+    def test_solutions_match_solve_board_in_input_order(self) -> None:
+        boards = [
+            EASY_BOARD,
+            EXPERT_BOARD,
+            [list(column) for column in zip(*EASY_BOARD)],
+            [list(column) for column in zip(*EXPERT_BOARD)]
+            ]
+
+        solutions = Sudoku.solve_boards(boards, processes=2)
+
+        self.assertEqual(
+            solutions,
+            [Sudoku.solve_board(board) for board in boards]
+            )
+
+    def test_worker_error_reaches_the_caller(self) -> None:
+        unsolvable = [[0] * 9 for _ in range(9)]
+        unsolvable[0] = [1, 2, 3, 4, 5, 6, 7, 8, 0]
+        unsolvable[1][8] = 9
+        with self.assertRaises(Sudoku.InvalidGameSolution):
+            Sudoku.solve_boards([EASY_BOARD, unsolvable], processes=2)
+
+
+if __name__ == "__main__":
+    unittest.main()